@@ -38,6 +38,7 @@ class FisherKernel:
             )
 
         self.model = model
+        self._gradient_function = None
 
     def get_features(self, dataset, batch_size=None):
         """Get the Fisher features.
@@ -66,6 +67,22 @@ class FisherKernel:
             shuffle=False,
         )
 
+        # Get only variables in the generative model, the trainable
+        # variables don't change so we only need to do this once
+        generative_variable_names = [
+            var.name
+            for var in self.model.trainable_weights
+            if (
+                "mod" in var.name
+                or "alpha" in var.name
+                or "gamma" in var.name
+                or "means" in var.name
+                or "covs" in var.name
+                or "stds" in var.name
+                or "fcs" in var.name
+            )
+        ]
+
         # Initialise list to hold features for each session
         features = []
         for i in trange(n_sessions, desc="Getting features"):
@@ -78,21 +95,8 @@ class FisherKernel:
                 d_model["d_initial_distribution"] = []
                 d_model["d_trans_prob"] = []
 
-            trainable_variable_names = [
-                var.name for var in self.model.trainable_weights
-            ]
-            # Get only variable in the generative model
-            for name in trainable_variable_names:
-                if (
-                    "mod" in name
-                    or "alpha" in name
-                    or "gamma" in name
-                    or "means" in name
-                    or "covs" in name
-                    or "stds" in name
-                    or "fcs" in name
-                ):
-                    d_model[name] = []
+            for name in generative_variable_names:
+                d_model[name] = []
 
             # Loop over data for each session
             for inputs in session_data:
@@ -202,9 +206,17 @@ class FisherKernel:
         """
         import tensorflow as tf  # avoid slow imports
 
-        with tf.GradientTape() as tape:
-            loss = self.model.model(inputs)
+        if self._gradient_function is None:
+            # Trace the gradient calculation once rather than running it
+            # eagerly for every batch
             trainable_weights = {var.name: var for var in self.model.trainable_weights}
-            gradients = tape.gradient(loss, trainable_weights)
 
-        return gradients
+            @tf.function(reduce_retracing=True)
+            def _gradient_function(inputs):
+                with tf.GradientTape() as tape:
+                    loss = self.model.model(inputs)
+                return tape.gradient(loss, trainable_weights)
+
+            self._gradient_function = _gradient_function
+
+        return self._gradient_function(inputs)
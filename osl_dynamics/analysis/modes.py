@@ -132,22 +132,23 @@ def raw_covariances(
         error_message=error_message,
     )
 
-    # Get covariance of time embedded data
-    if pca_components is not None:
-        te_covs = reverse_pca(mode_covariances, pca_components)
-    else:
-        te_covs = mode_covariances
-
     if zero_lag:
         # Return the zero-lag elements only
-        raw_covs = te_covs[
-            :,
-            :,
-            n_embeddings // 2 :: n_embeddings,
-            n_embeddings // 2 :: n_embeddings,
-        ]
+        zero_lag_indices = slice(n_embeddings // 2, None, n_embeddings)
+        if pca_components is not None:
+            # Only reverse PCA for the zero-lag channels, this avoids
+            # calculating the full time embedded covariance
+            raw_covs = reverse_pca(mode_covariances, pca_components[zero_lag_indices])
+        else:
+            raw_covs = mode_covariances[:, :, zero_lag_indices, zero_lag_indices]
 
     else:
+        # Get covariance of time embedded data
+        if pca_components is not None:
+            te_covs = reverse_pca(mode_covariances, pca_components)
+        else:
+            te_covs = mode_covariances
+
         # Return block means
         n_sessions = te_covs.shape[0]
         n_modes = te_covs.shape[1]
@@ -203,7 +203,7 @@ def compute_fo_stats(
         temp_to = []
         temp_away = []
         for i in intervals:
-            d = int(np.floor((np.diff(i) - 1) / 2))
+            d = (i[1] - i[0] - 1) // 2
             temp_away.append(tc_sec[i[0] : i[0] + d + 1, :])
             temp_to.append(tc_sec[i[1] - d - 1 : i[1], :])
 
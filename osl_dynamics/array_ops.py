@@ -57,8 +57,9 @@ def get_one_hot(values, n_states=None):
         values = values.argmax(axis=1)
     if n_states is None:
         n_states = values.max() + 1
-    res = np.eye(n_states)[np.array(values).reshape(-1)]
-    return res.reshape([*list(values.shape), n_states]).astype(int)
+    # Gather rows of an integer identity matrix, this avoids creating a
+    # float array which needs to be cast
+    return np.eye(n_states, dtype=int)[np.asarray(values)]
 
 
 def cov2corr(cov):
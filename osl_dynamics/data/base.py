@@ -8,8 +8,10 @@ import os
 import pathlib
 import pickle
 import random
+from collections.abc import Sequence
 from contextlib import contextmanager
-from shutil import rmtree
+from functools import lru_cache
+from shutil import copyfile, rmtree
 from dataclasses import dataclass
 
 import numpy as np
@@ -21,6 +23,9 @@ from osl_dynamics.utils import misc
 
 _logger = logging.getLogger("osl-dynamics")
 
+# Buffer size for reading/writing the preparation pickle file
+_PICKLE_BUFFER_SIZE = 8 * 1024 * 1024
+
 
 class Data:
     """Data Class.
@@ -77,6 +82,7 @@ class Data:
     load_memmaps : bool, optional
         Should we load the data as memory maps (memmaps)? If :code:`True`, we
         will load store the data on disk rather than loading it into memory.
+        The raw data memory maps are read-only.
     store_dir : str, optional
         If `load_memmaps=True`, then we save data to disk and load it as
         a memory map. This is the directory to save the memory maps to.
@@ -150,11 +156,9 @@ class Data:
         self.arrays = self.raw_data_arrays
 
         # Create filenames for prepared data memmaps
-        prepared_data_pattern = "prepared_data_{{i:0{width}d}}_{identifier}.npy".format(
-            width=len(str(self.n_sessions)), identifier=self._identifier
-        )
+        width = len(str(self.n_sessions))
         self.prepared_data_filenames = [
-            str(self.store_dir / prepared_data_pattern.format(i=i))
+            f"{self.store_dir}/prepared_data_{i:0{width}d}_{self._identifier}.npy"
             for i in range(self.n_sessions)
         ]
 
@@ -184,7 +188,7 @@ class Data:
     @property
     def raw_data(self):
         """Return raw data as a list of arrays."""
-        return self.raw_data_arrays
+        return list(self.raw_data_arrays)
 
     @property
     def n_channels(self):
@@ -273,7 +277,7 @@ class Data:
         if concatenate or self.n_sessions == 1:
             return np.concatenate(arrays)
         else:
-            return arrays
+            return list(arrays)
 
     def load_raw_data(self):
         """Import data into a list of memory maps.
@@ -285,11 +289,9 @@ class Data:
         raw_data_filenames : list of str
             List of paths to the raw data memmaps.
         """
-        raw_data_pattern = "raw_data_{{i:0{width}d}}_{identifier}.npy".format(
-            width=len(str(len(self.inputs))), identifier=self._identifier
-        )
+        width = len(str(len(self.inputs)))
         raw_data_filenames = [
-            str(self.store_dir / raw_data_pattern.format(i=i))
+            f"{self.store_dir}/raw_data_{i:0{width}d}_{self._identifier}.npy"
             for i in range(len(self.inputs))
         ]
         # self.raw_data_filenames is not used if self.inputs is a list of
@@ -306,27 +308,43 @@ class Data:
                 self.reject_by_annotation,
                 mmap_location,
                 mmap_mode="r",
+                access_pattern="sequential",
+                time_axis_first=self.time_axis_first,
             )
-            if not self.time_axis_first:
-                raw_data_mmap = raw_data_mmap.T
+            if self.load_memmaps and _is_npy_memmap(raw_data_mmap):
+                # Only keep the filename, the memory map is opened when it's
+                # accessed so we don't hold a file descriptor for each file
+                return raw_data_mmap.filename
             return raw_data_mmap
 
-        # Load data
+        # In-memory arrays only need to be copied, so we don't need a
+        # thread pool
+        if not self.load_memmaps and all(
+            isinstance(raw_data, np.ndarray) for raw_data in self.inputs
+        ):
+            memmaps = [_make_memmap(raw_data, None) for raw_data in self.inputs]
+            return memmaps, raw_data_filenames
+
+        # Load data, there's no point using more threads than files
         memmaps = pqdm(
             array=zip(self.inputs, raw_data_filenames),
             function=_make_memmap,
-            n_jobs=self.n_jobs,
+            n_jobs=min(self.n_jobs, len(self.inputs)),
             desc="Loading files",
             argument_type="args",
             total=len(self.inputs),
         )
 
+        if self.load_memmaps:
+            # Only keep a limited number of memory maps open at once
+            memmaps = _LazyMemmapList(memmaps)
+
         return memmaps, raw_data_filenames
 
     def validate_data(self):
         """Validate data files."""
-        n_channels = [array.shape[-1] for array in self.raw_data_arrays]
-        if not np.equal(n_channels, n_channels[0]).all():
+        n_channels = self.raw_data_arrays[0].shape[-1]
+        if not all(array.shape[-1] == n_channels for array in self.raw_data_arrays):
             raise ValueError("All inputs should have the same number of channels.")
 
     def select(self, channels=None, use_raw=False):
@@ -557,14 +575,16 @@ class Data:
                 std_data = processing.standardize(array)
                 covariance += np.transpose(std_data) @ std_data
 
-            # Use SVD on the covariance to calculate PCA components
-            u, s, vh = np.linalg.svd(covariance)
+            # Eigendecomposition of the (symmetric) covariance gives the PCA
+            # components, in descending order of variance
+            s, u = np.linalg.eigh(covariance)
+            s, u = s[::-1], u[:, ::-1]
             u = u[:, :n_pca_components].astype(np.float32)
             self.explained_variance = np.sum(s[:n_pca_components]) / np.sum(s)
             _logger.info(f"Explained variance: {100 * self.explained_variance:.1f}%")
             s = s[:n_pca_components].astype(np.float32)
             if whiten:
-                u = u @ np.diag(1.0 / np.sqrt(s))
+                u = u / np.sqrt(s)
             self.pca_components = u
 
         # Function to apply PCA to a single array
@@ -702,14 +722,16 @@ class Data:
                 te_std_data = processing.time_embed(std_data, n_embeddings)
                 covariance += np.transpose(te_std_data) @ te_std_data
 
-            # Use SVD on the covariance to calculate PCA components
-            u, s, vh = np.linalg.svd(covariance)
+            # Eigendecomposition of the (symmetric) covariance gives the PCA
+            # components, in descending order of variance
+            s, u = np.linalg.eigh(covariance)
+            s, u = s[::-1], u[:, ::-1]
             u = u[:, :n_pca_components].astype(np.float32)
             self.explained_variance = np.sum(s[:n_pca_components]) / np.sum(s)
             _logger.info(f"Explained variance: {100 * self.explained_variance:.1f}%")
             s = s[:n_pca_components].astype(np.float32)
             if whiten:
-                u = u @ np.diag(1.0 / np.sqrt(s))
+                u = u / np.sqrt(s)
             self.pca_components = u
 
         # Function to apply TDE-PCA to a single array
@@ -1060,6 +1082,7 @@ class Data:
         concatenate=True,
         step_size=None,
         drop_last_batch=False,
+        cache=False,
     ):
         """Create a Tensorflow Dataset for training or evaluation.
 
@@ -1081,6 +1104,10 @@ class Data:
             Default is no overlap.
         drop_last_batch : bool, optional
             Should we drop the last batch if it is smaller than the batch size?
+        cache : bool, optional
+            Should we cache the sequences in memory after the first epoch?
+            This avoids re-creating the sequences each epoch, but requires
+            the prepared data to fit in memory.
 
         Returns
         -------
@@ -1113,6 +1140,9 @@ class Data:
                 self.sequence_length,
                 self.step_size,
             )
+            if cache:
+                # Cache before shuffling so we get a new order each epoch
+                dataset = dataset.cache()
             datasets.append(dataset)
 
         # Create a dataset from all the arrays concatenated
@@ -1459,7 +1489,22 @@ class Data:
             if item in attributes:
                 attributes.remove(item)
         preparation = {a: getattr(self, a) for a in attributes}
-        pickle.dump(preparation, open(f"{output_dir}/preparation.pkl", "wb"))
+
+        # Save the PCA components in numpy format, so they can be loaded
+        # without unpickling. We don't use a .npy extension to avoid this
+        # file being loaded as data
+        pca_components_file = f"{output_dir}/pca_components.bin"
+        if preparation.get("pca_components") is not None:
+            with open(pca_components_file, "wb") as file:
+                np.save(file, preparation.pop("pca_components"))
+        elif os.path.exists(pca_components_file):
+            # Remove components from a previous save so they aren't loaded
+            os.remove(pca_components_file)
+
+        with open(
+            f"{output_dir}/preparation.pkl", "wb", buffering=_PICKLE_BUFFER_SIZE
+        ) as file:
+            pickle.dump(preparation, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_preparation(self, inputs):
         """Loads a pickle file containing preparation settings.
@@ -1470,15 +1515,21 @@ class Data:
             Path to directory containing the pickle file with preparation
             settings.
         """
-        if os.path.isdir(inputs):
-            for file in rw.list_dir(inputs):
-                if "preparation.pkl" in file:
-                    preparation = pickle.load(open(f"{inputs}/preparation.pkl", "rb"))
-                    for attr, value in preparation.items():
-                        setattr(self, attr, value)
-                    break
-
-    def save(self, output_dir="."):
+        if not isinstance(inputs, str):
+            return
+
+        preparation_file = f"{inputs}/preparation.pkl"
+        if os.path.isfile(preparation_file):
+            with open(preparation_file, "rb", buffering=_PICKLE_BUFFER_SIZE) as file:
+                preparation = pickle.load(file)
+            for attr, value in preparation.items():
+                setattr(self, attr, value)
+            if os.path.isfile(f"{inputs}/pca_components.bin"):
+                # Load into memory (the array is small), so saving to the
+                # same directory doesn't overwrite a file we have mapped
+                self.pca_components = np.load(f"{inputs}/pca_components.bin")
+
+    def save(self, output_dir=".", copy_mode="copy"):
         """Saves (prepared) data to numpy files.
 
         Parameters
@@ -1486,7 +1537,17 @@ class Data:
         output_dir : str
             Path to save data files to. Default is the current working
             directory.
+        copy_mode : str, optional
+            How to save arrays that are already memory maps of a :code:`.npy`
+            file. Either :code:`'copy'` (copy the file), :code:`'hardlink'`
+            (create a hard link to the file, falling back to a copy if this
+            fails) or :code:`'rewrite'` (read and write the array with
+            :code:`np.save`). Arrays that are not memory maps are always
+            written with :code:`np.save`.
         """
+        if copy_mode not in ["copy", "hardlink", "rewrite"]:
+            raise ValueError("copy_mode must be 'copy', 'hardlink' or 'rewrite'.")
+
         # Create output directory
         output_dir = pathlib.Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -1494,10 +1555,38 @@ class Data:
         # Function to save a single array
         def _save(i, arr):
             padded_number = misc.leading_zeros(i, self.n_sessions)
-            np.save(f"{output_dir}/array{padded_number}.npy", arr)
+            filename = f"{output_dir}/array{padded_number}.npy"
+            if (
+                isinstance(arr, np.memmap)
+                and arr.filename is not None
+                and os.path.exists(filename)
+                and os.path.samefile(arr.filename, filename)
+            ):
+                if _is_npy_memmap(arr):
+                    # The file already contains this array
+                    return
+                # Read the array into memory before we overwrite the file
+                # it maps
+                arr = np.array(arr)
+            if os.path.exists(filename):
+                # Remove the old file rather than writing into it, it may be
+                # a hard link to the user's source data
+                os.remove(filename)
+            if copy_mode != "rewrite" and _is_npy_memmap(arr):
+                # The array is already a .npy file on disk, so we can save it
+                # without reading it into memory
+                if copy_mode == "hardlink":
+                    try:
+                        os.link(arr.filename, filename)
+                        return
+                    except OSError:
+                        pass
+                copyfile(arr.filename, filename)
+            else:
+                np.save(filename, arr)
 
         # Save arrays in parallel
-        pqdm(
+        results = pqdm(
             enumerate(self.arrays),
             _save,
             desc="Saving data",
@@ -1505,6 +1594,12 @@ class Data:
             argument_type="args",
             total=self.n_sessions,
         )
+        if any([isinstance(e, Exception) for e in results]):
+            for i, e in enumerate(results):
+                if isinstance(e, Exception):
+                    e.args = (f"array {i}: {e}",)
+                    _logger.exception(e, exc_info=False)
+            raise e
 
         # Save preparation settings
         self.save_preparation(output_dir)
@@ -1515,6 +1610,84 @@ class Data:
             rmtree(self.store_dir)
 
 
+def _is_npy_memmap(array):
+    """Checks if an array is a memory map of an entire :code:`.npy` file.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array to check.
+
+    Returns
+    -------
+    is_npy_memmap : bool
+        Is the array a memory map containing all the data in a :code:`.npy`
+        file, with the same shape and data type?
+    """
+    if not isinstance(array, np.memmap) or array.filename is None:
+        return False
+    if array.mode not in ["r", "r+"] or not array.flags.c_contiguous:
+        # Copy-on-write memory maps may have changes that aren't on disk
+        return False
+    try:
+        # Only read the header rather than opening the file as an array
+        with open(array.filename, "rb") as file:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(file)
+            elif version == (2, 0):
+                header = np.lib.format.read_array_header_2_0(file)
+            else:
+                return False
+            offset = file.tell()
+    except ValueError:
+        # Not a .npy file
+        return False
+    shape, fortran_order, dtype = header
+    return (
+        not fortran_order
+        and shape == array.shape
+        and dtype == array.dtype
+        and offset == array.offset
+    )
+
+
+class _LazyMemmapList(Sequence):
+    """List of arrays where memory maps are opened when accessed.
+
+    Each memory map holds an open file descriptor, so we only keep the
+    :code:`max_open` most recently used memory maps open.
+
+    Parameters
+    ----------
+    items : list of str or np.ndarray
+        Paths to :code:`.npy` files, which are opened as read-only memory
+        maps when accessed, or arrays, which are returned as they are.
+    max_open : int, optional
+        Maximum number of memory maps to keep open.
+    """
+
+    def __init__(self, items, max_open=32):
+        self._items = list(items)
+        self._open = lru_cache(maxsize=max_open)(self._load)
+
+    def _load(self, i):
+        item = self._items[i]
+        if not isinstance(item, str):
+            return item
+        array = np.load(item, mmap_mode="r")
+        rw._madvise(array, "sequential")
+        return array
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._open(j) for j in range(len(self))[i]]
+        return self._open(range(len(self))[i])
+
+
 @dataclass
 class SessionLabels:
     """Class for session labels.
@@ -2,6 +2,8 @@
 
 """
 
+from functools import lru_cache
+
 import mne
 import numpy as np
 from scipy import signal
@@ -21,20 +23,18 @@ def standardize(x, axis=0, create_copy=True):
     axis : int, optional
         Axis on which to perform the transformation.
     create_copy : bool, optional
-        Should we return a new array containing the standardized data or modify
-        the original time series array?
+        Kept for backwards compatibility. A new array is always returned and
+        the original time series array is not modified.
 
     Returns
     -------
     X :  np.ndarray
         Standardized data.
     """
-    mean = np.expand_dims(np.mean(x, axis=axis), axis=axis)
-    std = np.expand_dims(np.std(x, axis=axis), axis=axis)
-    if create_copy:
-        X = (np.copy(x) - mean) / std
-    else:
-        X = (x - mean) / std
+    # Centre into a single output buffer, then scale it in-place
+    mean = np.mean(x, axis=axis, keepdims=True)
+    X = np.subtract(x, mean, dtype=np.result_type(x, np.float32))
+    X /= np.sqrt(np.mean(np.square(X), axis=axis, keepdims=True))
     return X
 
 
@@ -149,19 +149,28 @@ def moving_average(x, n_window):
     """
     if n_window % 2 == 0:
         raise ValueError("n_window must be odd.")
-    X = np.array(
-        [
-            np.convolve(
-                x[:, i],
-                np.ones(n_window) / n_window,
-                mode="valid",
-            )
-            for i in range(x.shape[1])
-        ],
-    ).T
+    X = _moving_average_kernel()(np.asarray(x), n_window)
     return X.astype(x.dtype)
 
 
+@lru_cache(maxsize=None)
+def _moving_average_kernel():
+    """Compile the moving average kernel the first time it's needed."""
+    import numba  # moved here to avoid slow imports
+
+    @numba.njit(cache=True)
+    def _moving_average(x, n_window):
+        # Sum each window into a preallocated (time, channels) array
+        X = np.zeros((x.shape[0] - n_window + 1, x.shape[1]))
+        for t in range(X.shape[0]):
+            for i in range(n_window):
+                X[t] += x[t + i]
+        X /= n_window
+        return X
+
+    return _moving_average
+
+
 def downsample(x, new_freq, old_freq):
     """Downsample.
 
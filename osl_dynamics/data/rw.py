@@ -3,7 +3,11 @@
 """
 
 import logging
-from os import listdir, path
+import mmap
+from functools import singledispatch
+from itertools import chain
+from os import path, scandir
+from os.path import splitext
 
 import mne
 import mat73
@@ -15,6 +19,7 @@ _logger = logging.getLogger("osl-dynamics")
 _allowed_ext = [".npy", ".mat", ".txt", ".fif"]
 
 
+@singledispatch
 def validate_inputs(inputs):
     """Validates inputs.
 
@@ -28,39 +33,41 @@ def validate_inputs(inputs):
     validated_inputs : list of str or str
         Validated inputs.
     """
-    if isinstance(inputs, str):
-        if path.isdir(inputs):
-            validated_inputs = list_dir(inputs, keep_ext=_allowed_ext)
-        else:
-            validated_inputs = [inputs]
+    raise ValueError("inputs must be str, np.ndarray or list.")
 
-    elif isinstance(inputs, np.ndarray):
-        if inputs.ndim == 1:
-            validated_inputs = [inputs[:, np.newaxis]]
-        elif inputs.ndim == 2:
-            validated_inputs = [inputs]
-        else:
-            validated_inputs = inputs
-
-    elif isinstance(inputs, list):
-        if len(inputs) == 0:
-            raise ValueError("Empty list passed.")
-        elif isinstance(inputs[0], str):
-            validated_inputs = []
-            for inp in inputs:
-                if path.isdir(inp):
-                    validated_inputs += list_dir(inp, keep_ext=_allowed_ext)
-                elif path.exists(inp):
-                    validated_inputs.append(inp)
-                else:
-                    _logger.warn(f"{inp} not found")
-        else:
-            validated_inputs = inputs
 
-    else:
-        raise ValueError("inputs must be str, np.ndarray or list.")
+@validate_inputs.register(str)
+def _validate_str_inputs(inputs):
+    if path.isdir(inputs):
+        return list_dir(inputs, keep_ext=_allowed_ext)
+    return [inputs]
+
 
-    return validated_inputs
+@validate_inputs.register(np.ndarray)
+def _validate_array_inputs(inputs):
+    if inputs.ndim == 1:
+        return [inputs[:, np.newaxis]]
+    elif inputs.ndim == 2:
+        return [inputs]
+    return inputs
+
+
+@validate_inputs.register(list)
+def _validate_list_inputs(inputs):
+    if len(inputs) == 0:
+        raise ValueError("Empty list passed.")
+    elif not isinstance(inputs[0], str):
+        return inputs
+
+    def _expand(inp):
+        if path.isdir(inp):
+            return list_dir(inp, keep_ext=_allowed_ext)
+        elif path.exists(inp):
+            return [inp]
+        _logger.warn(f"{inp} not found")
+        return []
+
+    return list(chain.from_iterable(map(_expand, inputs)))
 
 
 def file_ext(filename):
@@ -93,17 +100,14 @@ def list_dir(path, keep_ext=None):
     files : list
         Full path to files with the correct extension.
     """
-    files = []
-    if keep_ext is None:
-        for file in sorted(listdir(path)):
-            files.append(path + "/" + file)
-    else:
+    with scandir(path) as entries:
+        names = sorted(entry.name for entry in entries)
+    if keep_ext is not None:
         if isinstance(keep_ext, str):
             keep_ext = [keep_ext]
-        for file in sorted(listdir(path)):
-            if file_ext(file) in keep_ext:
-                files.append(path + "/" + file)
-    return files
+        keep_ext = frozenset(keep_ext)
+        names = [name for name in names if splitext(name)[1] in keep_ext]
+    return [path + "/" + name for name in names]
 
 
 def load_data(
@@ -113,6 +117,8 @@ def load_data(
     reject_by_annotation=None,
     mmap_location=None,
     mmap_mode="c",
+    access_pattern=None,
+    time_axis_first=True,
 ):
     """Loads time series data.
 
@@ -141,22 +147,35 @@ def load_data(
         Filename to save the data as a numpy memory map.
     mmap_mode : str, optional
         Mode to load memory maps in. Default is :code:`'c'`.
+    access_pattern : str, optional
+        How we expect a memory map to be read. Either :code:`'sequential'`
+        or :code:`'random'`. This is passed to the kernel with
+        :code:`madvise` to tune readahead. Default is no advice.
+    time_axis_first : bool, optional
+        Is the input data in the format (n_samples, n_channels)? If not, the
+        data is transposed. When a memory map is saved, it's written in
+        (n_samples, n_channels) order so it can be read contiguously.
 
     Returns
     -------
     data : np.memmap or np.ndarray
-        Data.
+        Data. Shape is (n_samples, n_channels).
     """
+    if access_pattern not in [None, "sequential", "random"]:
+        raise ValueError("access_pattern must be None, 'sequential' or 'random'.")
+
     if isinstance(data, np.ndarray):
-        data = data.astype(np.float32)
+        if not time_axis_first:
+            data = data.T
         if mmap_location is None:
-            return data
+            # Always copy, so in-place preparation doesn't modify the
+            # user's array
+            return np.array(data, dtype=np.float32, order="C", copy=True)
         else:
             # Save to a file so we can load data as a memory map
-            np.save(mmap_location, data)
-            data = mmap_location
+            _save_float32(mmap_location, data)
 
-    if isinstance(data, str):
+    elif isinstance(data, str):
         # Check if file/folder exists
         if not path.exists(data):
             raise FileNotFoundError(data)
@@ -166,53 +185,88 @@ def load_data(
         if ext not in _allowed_ext:
             raise ValueError(f"Data file must have extension: {_allowed_ext}.")
 
-        # Load a MATLAB file
-        if ext == ".mat":
-            data = load_matlab(data, data_field)
-            data = data.astype(np.float32)
-            if mmap_location is None:
-                return data
-            else:
-                # Save to a file so we can load data as a memory map
-                np.save(mmap_location, data)
-                data = mmap_location
-
         # Load a numpy file
-        elif ext == ".npy":
+        if ext == ".npy":
             if mmap_location is None:
                 data = np.load(data)
-                data = data.astype(np.float32)
-                return data
-            else:
+                if not time_axis_first:
+                    data = data.T
+                return np.ascontiguousarray(data, dtype=np.float32)
+            elif time_axis_first:
+                # We can use the file as the memory map
                 mmap_location = data
-
-        # Load a text file
-        elif ext == ".txt":
-            data = np.loadtxt(data)
-            data = data.astype(np.float32)
-            if mmap_location is None:
-                return data
             else:
-                np.save(mmap_location, data)
-                data = mmap_location
+                # Save a copy in (n_samples, n_channels) order
+                _save_float32(mmap_location, np.load(data, mmap_mode="r").T)
 
-        # Load a fif file
-        elif ext == ".fif":
-            data = load_fif(data, picks, reject_by_annotation)
-            data = data.astype(np.float32)
+        # Load other file types into memory
+        else:
+            data = _loaders[ext](
+                data,
+                data_field=data_field,
+                picks=picks,
+                reject_by_annotation=reject_by_annotation,
+            )
+            if not time_axis_first:
+                data = data.T
             if mmap_location is None:
-                return data
+                return np.ascontiguousarray(data, dtype=np.float32)
             else:
-                np.save(mmap_location, data)
-                data = mmap_location
+                # Save to a file so we can load data as a memory map
+                _save_float32(mmap_location, data)
 
     # Load data as memmap
     data = np.load(mmap_location, mmap_mode=mmap_mode)
-    data = data.astype(np.float32)
+    if access_pattern is not None:
+        _madvise(data, access_pattern)
+    data = data.astype(np.float32, copy=False)
 
     return data
 
 
+def _madvise(data, access_pattern):
+    """Advise the kernel how a memory map will be accessed.
+
+    This does nothing if :code:`madvise` is not supported on this platform.
+
+    Parameters
+    ----------
+    data : np.memmap
+        Memory map.
+    access_pattern : str
+        Either :code:`'sequential'` or :code:`'random'`.
+    """
+    advice = {"sequential": "MADV_SEQUENTIAL", "random": "MADV_RANDOM"}
+    try:
+        data._mmap.madvise(getattr(mmap, advice[access_pattern]))
+    except (AttributeError, OSError):
+        pass
+
+
+def _save_float32(filename, data, chunk_size=100000):
+    """Save an array to a :code:`.npy` file as :code:`float32`.
+
+    The array is converted in chunks along the first axis, so we do not need
+    to hold a :code:`float32` copy of the entire array in memory.
+
+    Parameters
+    ----------
+    filename : str
+        Path to :code:`.npy` file to save to.
+    data : np.ndarray
+        Array to save.
+    chunk_size : int, optional
+        Number of samples to convert at a time.
+    """
+    output = np.lib.format.open_memmap(
+        filename, mode="w+", dtype=np.float32, shape=data.shape
+    )
+    for i in range(0, data.shape[0], chunk_size):
+        output[i : i + chunk_size] = data[i : i + chunk_size]
+    output.flush()
+    del output
+
+
 def load_fif(filename, picks=None, reject_by_annotation=None):
     """Load a fif file.
 
@@ -302,3 +356,13 @@ def loadmat(filename, return_dict=False):
             mat = mat[fields[0]]
 
     return mat
+
+
+# Functions to load each non-numpy file type into memory
+_loaders = {
+    ".mat": lambda filename, **kwargs: load_matlab(filename, kwargs["data_field"]),
+    ".txt": lambda filename, **kwargs: np.loadtxt(filename),
+    ".fif": lambda filename, **kwargs: load_fif(
+        filename, kwargs["picks"], kwargs["reject_by_annotation"]
+    ),
+}
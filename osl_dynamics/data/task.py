@@ -43,8 +43,9 @@ def epoch(data, time_index, pre, post, pad=False):
         )
         time_index = time_index[keep]
 
-    starts, stops = time_index - pre, time_index + post
-    epoched = np.array([data[start:stop] for start, stop in zip(starts, stops)])
+    # Gather all epochs with a single indexing operation
+    starts = time_index - pre
+    epoched = data[starts[:, np.newaxis] + np.arange(pre + post)]
     return epoched
 
 
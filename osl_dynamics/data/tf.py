@@ -67,7 +67,7 @@ def create_dataset(data, sequence_length, step_size):
     dataset : tf.data.Dataset
         TensorFlow dataset.
     """
-    from tensorflow.data import Dataset  # moved here to avoid slow imports
+    from tensorflow.data import AUTOTUNE, Dataset  # moved here to avoid slow imports
 
     # Generate a non-overlapping sequence dataset
     if step_size == sequence_length:
@@ -96,7 +96,7 @@ def create_dataset(data, sequence_length, step_size):
             drop_remainder=True,
         )
         dataset = dataset.flat_map(batch_windows)
-        dataset = dataset.map(tuple_to_dict)
+        dataset = dataset.map(tuple_to_dict, num_parallel_calls=AUTOTUNE)
 
     return dataset
 
@@ -247,7 +247,9 @@ def load_tfrecord_dataset(
             )
 
             # Parse the examples
-            full_dataset = full_dataset.map(_parse_example)
+            full_dataset = full_dataset.map(
+                _parse_example, num_parallel_calls=tf.data.AUTOTUNE
+            )
 
             # Shuffle sequences
             full_dataset = full_dataset.shuffle(buffer_size)
@@ -267,7 +269,9 @@ def load_tfrecord_dataset(
             )
 
             # Parse the examples
-            full_dataset = full_dataset.map(_parse_example)
+            full_dataset = full_dataset.map(
+                _parse_example, num_parallel_calls=tf.data.AUTOTUNE
+            )
 
             # Group into batches
             full_dataset = full_dataset.batch(
@@ -302,7 +306,7 @@ def load_tfrecord_dataset(
             ds = tf.data.TFRecordDataset(filename)
 
             # Parse the examples
-            ds = ds.map(_parse_example)
+            ds = ds.map(_parse_example, num_parallel_calls=tf.data.AUTOTUNE)
 
             if shuffle:
                 # Shuffle sequences
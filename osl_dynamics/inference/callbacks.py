@@ -2,8 +2,9 @@
 
 """
 
+from math import tanh
+
 import numpy as np
-from tensorflow import tanh
 from tensorflow.keras import callbacks
 
 from osl_dynamics import inference
@@ -2,18 +2,27 @@
 
 """
 
+import weakref
 from copy import deepcopy
 
 import numpy as np
 import tensorflow as tf
 import tensorflow_probability as tfp
-from tensorflow.keras import Model, layers, initializers
+from tensorflow.keras import Model, layers
 from tensorflow.keras.initializers import Initializer
 
 from osl_dynamics import inference
 
 tfb = tfp.bijectors
 
+# Bijectors used to transform learnable vectors to covariance matrices.
+# These are stateless so we share them between all initializers.
+_CHOLESKY_BIJECTOR = tfb.Chain([tfb.CholeskyOuterProduct(), tfb.FillScaleTriL()])
+_CORRELATION_CHOLESKY_BIJECTOR = tfb.Chain(
+    [tfb.CholeskyOuterProduct(), tfb.CorrelationCholesky()]
+)
+_SOFTPLUS_BIJECTOR = tfb.Softplus()
+
 
 class WeightInitializer(Initializer):
     """Initialize weights to given value.
@@ -47,8 +56,8 @@ class RandomWeightInitializer(Initializer):
         self.std = std
 
     def __call__(self, shape, dtype=None):
-        e = initializers.TruncatedNormal(mean=0.0, stddev=self.std).__call__(
-            shape=shape, dtype=tf.float32
+        e = tf.random.truncated_normal(
+            shape=shape, mean=0.0, stddev=self.std, dtype=tf.float32
         )
         return self.initial_value + e
 
@@ -58,15 +67,19 @@ class IdentityCholeskyInitializer(Initializer):
     matrices."""
 
     def __init__(self):
-        # Bijector used to transform learnable vectors to covariance matrices
-        self.bijector = tfb.Chain([tfb.CholeskyOuterProduct(), tfb.FillScaleTriL()])
+        # The output only depends on the shape, so we cache it
+        self._cache = {}
 
     def __call__(self, shape, dtype=None):
         n = shape[0]  # n_modes
         m = int(np.sqrt(1 + 8 * shape[1]) / 2 - 0.5)  # n_channels
-        diagonals = np.ones([n, m])
-        matrices = np.array([np.diag(d) for d in diagonals], dtype=np.float32)
-        return self.bijector.inverse(matrices)
+        if (n, m) not in self._cache:
+            # Every mode has the same flattened cholesky factor, so we only
+            # need to invert a single identity matrix
+            identity = np.eye(m, dtype=np.float32)[np.newaxis]
+            flattened = np.asarray(_CHOLESKY_BIJECTOR.inverse(identity))
+            self._cache[(n, m)] = np.repeat(flattened, n, axis=0)
+        return self._cache[(n, m)]
 
 
 class NormalIdentityCholeskyInitializer(Initializer):
@@ -82,17 +95,15 @@ class NormalIdentityCholeskyInitializer(Initializer):
     def __init__(self, std):
         self.std = std
 
-        # Bijector used to transform learnable vectors to covariance matrices
-        self.bijector = tfb.Chain([tfb.CholeskyOuterProduct(), tfb.FillScaleTriL()])
-
     def __call__(self, shape, dtype=None):
         n = shape[0]  # n_modes
         m = int(np.sqrt(1 + 8 * shape[1]) / 2 - 0.5)  # n_channels
-        diagonals = initializers.TruncatedNormal(mean=1, stddev=self.std).__call__(
-            shape=(n, m), dtype=tf.float32
+        diagonals = tf.random.truncated_normal(
+            shape=(n, m), mean=1.0, stddev=self.std, dtype=tf.float32
         )
-        matrices = np.array([np.diag(d) for d in diagonals], dtype=np.float32)
-        return self.bijector.inverse(matrices)
+        matrices = np.zeros([n, m, m], dtype=np.float32)
+        matrices[:, np.arange(m), np.arange(m)] = np.asarray(diagonals)
+        return _CHOLESKY_BIJECTOR.inverse(matrices)
 
 
 class NormalCorrelationCholeskyInitializer(Initializer):
@@ -110,20 +121,16 @@ class NormalCorrelationCholeskyInitializer(Initializer):
     def __init__(self, std):
         self.std = std
 
-        # Bijector used to transform learnable vectors to covariance matrices
-        self.bijector = tfb.Chain(
-            [tfb.CholeskyOuterProduct(), tfb.CorrelationCholesky()]
-        )
-
     def __call__(self, shape, dtype=None):
         n = shape[0]  # n_modes
         m = int(np.sqrt(1 + 8 * shape[1]) / 2 + 0.5)  # n_channels
-        diagonals = np.ones([n, m])
-        matrices = np.array([np.diag(d) for d in diagonals], dtype=np.float32)
-        cholesky_factors = self.bijector.inverse(matrices)
-        cholesky_factors += initializers.TruncatedNormal(
-            mean=0, stddev=self.std
-        ).__call__(shape=cholesky_factors.shape, dtype=tf.float32)
+        diagonals = np.ones([n, m], dtype=np.float32)
+        matrices = np.zeros([n, m, m], dtype=np.float32)
+        matrices[:, np.arange(m), np.arange(m)] = diagonals
+        cholesky_factors = _CORRELATION_CHOLESKY_BIJECTOR.inverse(matrices)
+        cholesky_factors += tf.random.truncated_normal(
+            shape=cholesky_factors.shape, mean=0.0, stddev=self.std, dtype=tf.float32
+        )
         return cholesky_factors
 
 
@@ -139,16 +146,14 @@ class NormalDiagonalInitializer(Initializer):
     def __init__(self, std):
         self.std = std
 
-        # Softplus transformation to ensure diagonal is positive
-        self.bijector = tfb.Softplus()
-
     def __call__(self, shape, dtype=None):
         n = shape[0]  # n_modes
         m = shape[1]  # n_channels
-        diagonals = initializers.TruncatedNormal(mean=1, stddev=self.std).__call__(
-            shape=(n, m), dtype=tf.float32
+        diagonals = tf.random.truncated_normal(
+            shape=(n, m), mean=1.0, stddev=self.std, dtype=tf.float32
         )
-        return self.bijector.inverse(diagonals)
+        # Softplus transformation to ensure diagonal is positive
+        return _SOFTPLUS_BIJECTOR.inverse(diagonals)
 
 
 class CopyTensorInitializer(Initializer):
@@ -164,7 +169,7 @@ class CopyTensorInitializer(Initializer):
         self.tensor = tensor
 
     def __call__(self, shape, dtype=None):
-        return self.tensor.read_value()
+        return tf.identity(self.tensor.value())
 
 
 def reinitialize_layer_weights(layer):
@@ -221,22 +226,29 @@ def reinitialize_layer_weights(layer):
 
         # Assign new random values to the variable
         if var is not None:
-            var.assign(new_initializer(var.shape, var.dtype))
+            # Generate the new values on the same device as the variable
+            with tf.device(var.device):
+                var.assign(new_initializer(var.shape, var.dtype))
 
 
-def reinitialize_model_weights(model, keep=None):
-    """Re-initialize the weights in a model.
+def _collect_reinit_targets(model, keep):
+    """Get a flat list of the layers to re-initialize in a model.
 
     Parameters
     ----------
     model : tf.keras.Model
-        Model to re-initialize weights for.
-    keep : list, optional
+        Model to collect layers from.
+    keep : list
         List of :code:`str` containing names for layers to not reinitialize.
-    """
-    if keep is None:
-        keep = []
+        Only applied to the top level layers of :code:`model`.
 
+    Returns
+    -------
+    targets : list
+        List of :code:`tf.keras.layers.Layer` to pass to
+        :code:`reinitialize_layer_weights`.
+    """
+    targets = []
     for layer in model.layers:
         # Skip layers that we want to keep
         if layer.name in keep:
@@ -247,11 +259,41 @@ def reinitialize_model_weights(model, keep=None):
             # If the layer in bidirectional we need to re_initialise the
             # forward and backward layers.
             if isinstance(layer, layers.Bidirectional):
-                reinitialize_layer_weights(layer.forward_layer)
-                reinitialize_layer_weights(layer.backward_layer)
+                targets.append(layer.forward_layer)
+                targets.append(layer.backward_layer)
             else:
-                reinitialize_layer_weights(layer)
-        # If the layer consists of multiple layers pass the layer back
-        # to this function recursively
+                targets.append(layer)
+        # If the layer consists of multiple layers collect its layers
+        # recursively
         else:
-            reinitialize_model_weights(layer)
+            targets += _collect_reinit_targets(layer, keep=[])
+    return targets
+
+
+# Layers to re-initialize for each model, we hold weak references to the
+# models so that the cache doesn't keep them alive
+_reinit_targets = weakref.WeakKeyDictionary()
+
+
+def reinitialize_model_weights(model, keep=None):
+    """Re-initialize the weights in a model.
+
+    Parameters
+    ----------
+    model : tf.keras.Model
+        Model to re-initialize weights for.
+    keep : list, optional
+        List of :code:`str` containing names for layers to not reinitialize.
+    """
+    if keep is None:
+        keep = []
+
+    # Walking the layers of a model is slow, so we only do it once
+    # for each model and list of layers to keep
+    model_targets = _reinit_targets.setdefault(model, {})
+    key = frozenset(keep)
+    if key not in model_targets:
+        model_targets[key] = _collect_reinit_targets(model, keep)
+
+    for layer in model_targets[key]:
+        reinitialize_layer_weights(layer)
@@ -951,9 +951,7 @@ class MixVectorsLayer(layers.Layer):
         alpha, mu = inputs
 
         # Calculate the mixture: m_t = Sum_j alpha_jt mu_j
-        alpha = tf.expand_dims(alpha, axis=-1)
-        mu = tf.expand_dims(tf.expand_dims(mu, axis=0), axis=0)
-        m = tf.reduce_sum(tf.multiply(alpha, mu), axis=2)
+        m = tf.einsum("btj,jc->btc", alpha, mu)
         return m
 
 
@@ -972,9 +970,7 @@ class MixMatricesLayer(layers.Layer):
         alpha, D = inputs
 
         # Calculate the mixture: C_t = Sum_j alpha_jt D_j
-        alpha = tf.expand_dims(tf.expand_dims(alpha, axis=-1), axis=-1)
-        D = tf.expand_dims(tf.expand_dims(D, axis=0), axis=0)
-        C = tf.reduce_sum(tf.multiply(alpha, D), axis=2)
+        C = tf.einsum("btj,jcd->btcd", alpha, D)
         return C
 
 
@@ -1188,7 +1184,9 @@ class InferenceRNNLayer(layers.Layer):
     reg : str
         Regularization for each layer.
     kwargs : keyword arguments, optional
-        Keyword arguments to pass to the base class.
+        Keyword arguments to pass to the base class. If a mixed precision
+        :code:`dtype` policy is passed, e.g. :code:`'mixed_float16'`, the RNN
+        is calculated in reduced precision and the output is cast to float32.
     """
 
     def __init__(
@@ -1216,17 +1214,21 @@ class InferenceRNNLayer(layers.Layer):
                         activity_regularizer=reg,
                         return_sequences=True,
                         stateful=False,
-                    )
+                        dtype=self.dtype_policy,
+                    ),
+                    dtype=self.dtype_policy,
                 )
             )
-            self.layers.append(NormalizationLayer(norm_type))
-            self.layers.append(layers.Activation(act_type))
-            self.layers.append(layers.Dropout(drop_rate))
+            self.layers.append(NormalizationLayer(norm_type, dtype=self.dtype_policy))
+            self.layers.append(layers.Activation(act_type, dtype=self.dtype_policy))
+            self.layers.append(layers.Dropout(drop_rate, dtype=self.dtype_policy))
 
     def call(self, inputs, **kwargs):
         for layer in self.layers:
             inputs = layer(inputs, **kwargs)
-        return inputs
+
+        # Layers after this one expect float32
+        return tf.cast(inputs, tf.float32)
 
 
 class ModelRNNLayer(layers.Layer):
@@ -1249,7 +1251,9 @@ class ModelRNNLayer(layers.Layer):
     reg : str
         Regularization for each layer.
     kwargs : keyword arguments, optional
-        Keyword arguments to pass to the base class.
+        Keyword arguments to pass to the base class. If a mixed precision
+        :code:`dtype` policy is passed, e.g. :code:`'mixed_float16'`, the RNN
+        is calculated in reduced precision and the output is cast to float32.
     """
 
     def __init__(
@@ -1276,16 +1280,19 @@ class ModelRNNLayer(layers.Layer):
                     activity_regularizer=reg,
                     return_sequences=True,
                     stateful=False,
+                    dtype=self.dtype_policy,
                 )
             )
-            self.layers.append(NormalizationLayer(norm_type))
-            self.layers.append(layers.Activation(act_type))
-            self.layers.append(layers.Dropout(drop_rate))
+            self.layers.append(NormalizationLayer(norm_type, dtype=self.dtype_policy))
+            self.layers.append(layers.Activation(act_type, dtype=self.dtype_policy))
+            self.layers.append(layers.Dropout(drop_rate, dtype=self.dtype_policy))
 
     def call(self, inputs, **kwargs):
         for layer in self.layers:
             inputs = layer(inputs, **kwargs)
-        return inputs
+
+        # Layers after this one expect float32
+        return tf.cast(inputs, tf.float32)
 
 
 class CategoricalKLDivergenceLayer(layers.Layer):
@@ -1357,12 +1364,15 @@ class CategoricalLogLikelihoodLossLayer(layers.Layer):
             mu = tf.gather(mu, session_id)
             sigma = tf.gather(sigma, session_id)
 
+        # Cholesky factors for all states
+        sigma_cholesky = tf.linalg.cholesky(sigma)
+
         # Log-likelihood for each state
         ll_loss = tf.zeros(shape=tf.shape(x)[:-1])
         for i in range(self.n_states):
             mvn = tfp.distributions.MultivariateNormalTriL(
                 loc=tf.gather(mu, i, axis=-2),
-                scale_tril=tf.linalg.cholesky(tf.gather(sigma, i, axis=-3)),
+                scale_tril=tf.gather(sigma_cholesky, i, axis=-3),
                 allow_nan_stats=False,
             )
             a = mvn.log_prob(x)
@@ -1516,16 +1526,10 @@ class MixSessionSpecificParametersLayer(layers.Layer):
         # - D.shape       = (None, n_modes, n_channels, n_channels)
         alpha, mu, D = inputs
 
-        # Add the sequence dimension
-        mu = tf.expand_dims(mu, axis=1)
-        D = tf.expand_dims(D, axis=1)
-
-        # Next mix with the time course
-        alpha = tf.expand_dims(alpha, axis=-1)
-        m = tf.reduce_sum(tf.multiply(alpha, mu), axis=2)
-
-        alpha = tf.expand_dims(alpha, axis=-1)
-        C = tf.reduce_sum(tf.multiply(alpha, D), axis=2)
+        # Mix with the time course, contracting over modes directly
+        # avoids creating a (None, sequence_length, n_modes, ...) tensor
+        m = tf.einsum("btj,bjc->btc", alpha, mu)
+        C = tf.einsum("btj,bjcd->btcd", alpha, D)
 
         return m, C
 
@@ -1914,12 +1918,15 @@ class SeparateLogLikelihoodLayer(layers.Layer):
         mu = tf.expand_dims(mu, axis=1)
         sigma = tf.expand_dims(sigma, axis=1)
 
+        # Cholesky factors for all states
+        sigma_cholesky = tf.linalg.cholesky(sigma)
+
         # Calculate log-likelihood for each state
         log_likelihood = tf.TensorArray(tf.float32, size=n_states)
         for state in range(n_states):
             mvn = tfp.distributions.MultivariateNormalTriL(
                 loc=tf.gather(mu, state, axis=-2),
-                scale_tril=tf.linalg.cholesky(tf.gather(sigma, state, axis=-3)),
+                scale_tril=tf.gather(sigma_cholesky, state, axis=-3),
                 allow_nan_stats=False,
             )
             log_likelihood = log_likelihood.write(state, mvn.log_prob(x))
@@ -1985,9 +1992,14 @@ class EmbeddingLayer(layers.Layer):
         Output dimension.
     unit_norm : bool, optional
         Should the embeddings be unit norm?
+    identity_lookup : bool, optional
+        Are the inputs always :code:`0, 1, ..., input_dim - 1`? If so,
+        we return the embeddings directly rather than looking them up.
     """
 
-    def __init__(self, input_dim, output_dim, unit_norm, **kwargs):
+    def __init__(
+        self, input_dim, output_dim, unit_norm, identity_lookup=False, **kwargs
+    ):
         super().__init__(**kwargs)
         if unit_norm:
             output_dim = output_dim - 1
@@ -1998,8 +2010,17 @@ class EmbeddingLayer(layers.Layer):
         )
         self.layers = [self.embedding_layer]
         self.unit_norm = unit_norm
+        self.identity_lookup = identity_lookup
+
+    def build(self, input_shape):
+        # The embedding layer isn't called if we skip the lookup
+        self.embedding_layer.build(input_shape)
+        self.built = True
 
     def call(self, inputs, **kwargs):
+        if self.identity_lookup:
+            return self.embeddings
+
         output = self.embedding_layer(inputs)
 
         # Add the last element to ensure the embeddings are unit norm
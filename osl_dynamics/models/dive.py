@@ -147,6 +147,9 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
 
     n_sessions : int
         Number of sessions whose observation model parameters can vary.
@@ -565,6 +568,9 @@ def _model_structure(config):
                 session_label.n_classes,
                 config.embeddings_dim,
                 config.unit_norm_embeddings,
+                identity_lookup=np.array_equal(
+                    session_label.values, np.arange(session_label.n_classes)
+                ),
                 name=f"{session_label.name}_embeddings",
             )
             if session_label.label_type == "categorical"
@@ -155,6 +155,13 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    mixed_precision : str
+        Mixed precision policy for the inference and model RNNs. Either
+        :code:`None`, :code:`'mixed_float16'` or :code:`'mixed_bfloat16'`.
+        The observation model is always calculated in float32.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "DyNeMo"
@@ -177,6 +184,9 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
     model_dropout: float = 0.0
     model_regularizer: str = None
 
+    # Mixed precision policy for the inference and model RNNs
+    mixed_precision: str = None
+
     # Observation model parameters
     learn_means: bool = None
     learn_covariances: bool = None
@@ -202,6 +212,12 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
         if self.model_n_units is None:
             raise ValueError("Please pass model_n_units.")
 
+        if self.mixed_precision not in [None, "mixed_float16", "mixed_bfloat16"]:
+            raise ValueError(
+                "mixed_precision must be None, 'mixed_float16' or "
+                + "'mixed_bfloat16'."
+            )
+
     def validate_observation_model_parameters(self):
         if self.learn_means is None or self.learn_covariances is None:
             raise ValueError("learn_means and learn_covariances must be passed.")
@@ -667,6 +683,7 @@ class Model(VariationalInferenceModelBase):
             config.inference_dropout,
             config.inference_regularizer,
             name="inf_rnn",
+            dtype=config.mixed_precision,
         )
         inf_mu_layer = layers.Dense(config.n_modes, name="inf_mu")
         inf_sigma_layer = layers.Dense(
@@ -748,6 +765,7 @@ class Model(VariationalInferenceModelBase):
             config.model_dropout,
             config.model_regularizer,
             name="mod_rnn",
+            dtype=config.mixed_precision,
         )
         mod_mu_layer = layers.Dense(config.n_modes, name="mod_mu")
         mod_sigma_layer = layers.Dense(
@@ -133,6 +133,9 @@ class Config(BaseModelConfig, MarkovStateInferenceModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
 
     do_kl_annealing : bool
         Should we use KL annealing during training?
@@ -650,6 +653,9 @@ def _model_structure(config):
                 session_label.n_classes,
                 config.embeddings_dim,
                 config.unit_norm_embeddings,
+                identity_lookup=np.array_equal(
+                    session_label.values, np.arange(session_label.n_classes)
+                ),
                 name=f"{session_label.name}_embeddings",
             )
             if session_label.label_type == "categorical"
@@ -119,6 +119,9 @@ class Config(BaseModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "HMM"
@@ -249,8 +252,9 @@ class Model(ModelBase):
             )
             backend.set_value(self.model.optimizer.lr, lr)
 
-            # Loop over batches
-            loss = []
+            # Loop over batches, keeping a running sum of the loss
+            loss_sum = 0.0
+            n_batches = 0
             for data in dataset:
                 x = data["data"]
 
@@ -274,19 +278,21 @@ class Model(ModelBase):
                 if np.isnan(l):
                     _logger.error("Training failed!")
                     return
-                loss.append(l)
+                loss_sum += l
+                n_batches += 1
 
                 if verbose > 0:
                     # Update progress bar
                     if use_tqdm:
-                        _range.set_postfix(rho=self.rho, lr=lr, loss=l)
+                        # Don't redraw the progress bar on every batch
+                        _range.set_postfix(rho=self.rho, lr=lr, loss=l, refresh=False)
                     else:
                         pb_i.add(
                             1,
                             values=[("rho", self.rho), ("lr", lr), ("loss", l)],
                         )
 
-            history["loss"].append(np.mean(loss))
+            history["loss"].append(loss_sum / n_batches if n_batches else np.nan)
             history["rho"].append(self.rho)
             history["lr"].append(lr)
 
@@ -562,12 +568,15 @@ class Model(ModelBase):
 
         # Calculate the log-likelihood for each state to have generated the
         # observed data
+        #
+        # The cholesky factors for all states are calculated in a single call
+        covs_cholesky = tf.linalg.cholesky(covs)
         log_likelihood = np.empty([n_states, batch_size, sequence_length])
         for state in range(n_states):
             mvn = tf.stop_gradient(
                 tfp.distributions.MultivariateNormalTriL(
                     loc=tf.gather(means, state, axis=-2),
-                    scale_tril=tf.linalg.cholesky(tf.gather(covs, state, axis=-3)),
+                    scale_tril=tf.gather(covs_cholesky, state, axis=-3),
                     allow_nan_stats=False,
                 )
             )
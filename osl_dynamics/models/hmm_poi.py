@@ -82,6 +82,9 @@ class Config(BaseModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "HMM-Poisson"
@@ -1092,7 +1092,7 @@ class MarkovStateInferenceModelBase(ModelBase):
         )
 
         # Compile
-        self.model.compile(optimizer)
+        self.model.compile(optimizer, jit_compile=self.config.jit_compile)
 
     def predict(self, *args, **kwargs):
         """Wrapper for the standard keras predict method.
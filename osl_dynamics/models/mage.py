@@ -136,6 +136,9 @@ class Config(BaseModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "MAGE"
@@ -278,6 +281,7 @@ class Model(ModelBase):
             loss="binary_crossentropy",
             optimizer=self.config.optimizer.lower(),
             metrics=["accuracy"],
+            jit_compile=self.config.jit_compile,
         )
         self.discriminator_model_mean.trainable = False
 
@@ -285,6 +289,7 @@ class Model(ModelBase):
             loss="binary_crossentropy",
             optimizer=self.config.optimizer.lower(),
             metrics=["accuracy"],
+            jit_compile=self.config.jit_compile,
         )
         self.discriminator_model_cov.trainable = False
 
@@ -319,6 +324,7 @@ class Model(ModelBase):
             loss=[ll_loss, "binary_crossentropy", "binary_crossentropy"],
             loss_weights=[0.990, 0.005, 0.005],
             optimizer=optimizer,
+            jit_compile=self.config.jit_compile,
         )
 
     def fit(self, training_data, epochs=None, verbose=1):
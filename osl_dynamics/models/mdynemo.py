@@ -152,6 +152,13 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    mixed_precision : str
+        Mixed precision policy for the inference and model RNNs. Either
+        :code:`None`, :code:`'mixed_float16'` or :code:`'mixed_bfloat16'`.
+        The observation model is always calculated in float32.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "M-DyNeMo"
@@ -174,6 +181,9 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
     model_dropout: float = 0.0
     model_regularizer: str = None
 
+    # Mixed precision policy for the inference and model RNNs
+    mixed_precision: str = None
+
     # Observation model parameters
     n_fc_modes: int = None
     learn_means: bool = None
@@ -206,6 +216,12 @@ class Config(BaseModelConfig, VariationalInferenceModelConfig):
         if self.model_n_units is None:
             raise ValueError("Please pass model_n_units.")
 
+        if self.mixed_precision not in [None, "mixed_float16", "mixed_bfloat16"]:
+            raise ValueError(
+                "mixed_precision must be None, 'mixed_float16' or "
+                + "'mixed_bfloat16'."
+            )
+
     def validate_observation_model_parameters(self):
         if (
             self.learn_means is None
@@ -549,6 +565,7 @@ def _model_structure(config):
         config.inference_dropout,
         config.inference_regularizer,
         name="inf_rnn",
+        dtype=config.mixed_precision,
     )
 
     # Data flow
@@ -714,6 +731,7 @@ def _model_structure(config):
         config.model_dropout,
         config.model_regularizer,
         name="mod_rnn",
+        dtype=config.mixed_precision,
     )
 
     # Data flow
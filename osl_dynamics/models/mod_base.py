@@ -47,6 +47,7 @@ class BaseModelConfig:
     optimizer: tf.keras.optimizers.Optimizer = "adam"
     multi_gpu: bool = False
     strategy: str = None
+    jit_compile: bool = False
 
     # Dimension parameters
     n_modes: int = None
@@ -148,7 +149,10 @@ class ModelBase:
                     },
                 }
             )
-        self.model.compile(optimizer)
+        if getattr(self.config, "mixed_precision", None) == "mixed_float16":
+            # Scale the loss to avoid float16 gradients underflowing
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
+        self.model.compile(optimizer, jit_compile=self.config.jit_compile)
 
     def fit(
         self,
@@ -338,9 +342,13 @@ class ModelBase:
                     drop_last_batch=drop_last_batch,
                 )
 
-        elif isinstance(inputs, Dataset) and not concatenate:
+        elif isinstance(inputs, Dataset):
+            # Prepare the next batch while the current one is being used
+            outputs = inputs.prefetch(tf.data.AUTOTUNE)
+
             # Dataset -> list of Dataset if concatenate=False
-            outputs = [inputs]
+            if not concatenate:
+                outputs = [outputs]
 
         else:
             outputs = inputs
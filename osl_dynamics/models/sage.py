@@ -121,6 +121,9 @@ class Config(BaseModelConfig):
         Should be use multiple GPUs for training?
     strategy : str
         Strategy for distributed learning.
+    jit_compile : bool
+        Should we compile the training step with XLA? This fuses operations
+        for a fixed batch size and sequence length. Default is :code:`False`.
     """
 
     model_name: str = "SAGE"
@@ -224,6 +227,7 @@ class Model(ModelBase):
             loss="binary_crossentropy",
             optimizer=self.config.optimizer.lower(),
             metrics=["accuracy"],
+            jit_compile=self.config.jit_compile,
         )
         self.discriminator_model.trainable = False
 
@@ -258,6 +262,7 @@ class Model(ModelBase):
             loss=[ll_loss, "binary_crossentropy"],
             loss_weights=[0.995, 0.005],
             optimizer=optimizer,
+            jit_compile=self.config.jit_compile,
         )
 
     def fit(self, training_data, epochs=None, verbose=1):
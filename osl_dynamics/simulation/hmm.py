@@ -199,9 +199,9 @@ class HMM_MAR(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hmm):
+        elif hasattr(self.hmm, attr):
             return getattr(self.hmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -291,9 +291,9 @@ class HMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hmm):
+        elif hasattr(self.hmm, attr):
             return getattr(self.hmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -415,7 +415,7 @@ class MDyn_HMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -501,9 +501,9 @@ class HMM_Poi(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hmm):
+        elif hasattr(self.hmm, attr):
             return getattr(self.hmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -652,7 +652,7 @@ class MSess_HMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -813,9 +813,9 @@ class HierarchicalHMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hmm):
+        elif hasattr(self.hmm, attr):
             return getattr(self.hmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
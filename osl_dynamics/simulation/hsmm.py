@@ -215,9 +215,9 @@ class HSMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hsmm):
+        elif hasattr(self.hsmm, attr):
             return getattr(self.hsmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
@@ -335,9 +335,9 @@ class MixedHSMM_MVN(Simulation):
         return self.state_time_course
 
     def __getattr__(self, attr):
-        if attr in dir(self.obs_mod):
+        if hasattr(self.obs_mod, attr):
             return getattr(self.obs_mod, attr)
-        elif attr in dir(self.hsmm):
+        elif hasattr(self.hsmm, attr):
             return getattr(self.hsmm, attr)
         else:
             raise AttributeError(f"No attribute called {attr}.")
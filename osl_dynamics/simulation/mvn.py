@@ -673,11 +673,9 @@ class MSess_MVN(MVN):
         session_cholesky_covariances = np.zeros(
             [self.n_sessions, self.n_modes, self.n_channels, self.n_channels]
         )
-        for i in range(self.n_sessions):
-            for j in range(self.n_modes):
-                session_cholesky_covariances[i, j, m, n] = (
-                    flattened_session_cholesky_covariances[i, j]
-                )
+        session_cholesky_covariances[:, :, m, n] = (
+            flattened_session_cholesky_covariances
+        )
 
         session_covariances = session_cholesky_covariances @ np.transpose(
             session_cholesky_covariances, (0, 1, 3, 2)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from osl_dynamics.data import Data
+from osl_dynamics.data.base import _LazyMemmapList
+
+
+def _n_open_files():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+def test_lazy_memmap_list_bounds_open_maps(tmp_path):
+    filenames = []
+    for i in range(20):
+        filename = f"{tmp_path}/array{i}.npy"
+        np.save(filename, np.full((10, 2), i, dtype=np.float32))
+        filenames.append(filename)
+
+    n_open = _n_open_files()
+    arrays = _LazyMemmapList(filenames, max_open=4)
+    for i, array in enumerate(arrays):
+        assert isinstance(array, np.memmap)
+        assert array[0, 0] == i
+        del array
+    assert _n_open_files() - n_open <= 4
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+def test_data_load_memmaps_bounds_open_maps(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(40):
+        np.save(f"{data_dir}/array{i:02d}.npy", np.full((10, 2), i, dtype=np.float32))
+
+    n_open = _n_open_files()
+    data = Data(str(data_dir), load_memmaps=True, store_dir=str(tmp_path / "tmp"))
+    assert _n_open_files() - n_open <= 32
+
+    for i, array in enumerate(data.raw_data_arrays):
+        assert array[0, 0] == i
+        del array
+    assert _n_open_files() - n_open <= 32
+
+
+def test_data_save_hardlink_keeps_source(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    source = np.ones((10, 2), dtype=np.float32)
+    np.save(f"{source_dir}/array0.npy", source)
+
+    output_dir = str(tmp_path / "output")
+    data = Data(str(source_dir), load_memmaps=True, store_dir=str(tmp_path / "tmp"))
+    data.save(output_dir, copy_mode="hardlink")
+
+    # Overwrite the saved array with new data
+    data = Data(np.zeros((10, 2), dtype=np.float32))
+    data.save(output_dir)
+
+    np.testing.assert_array_equal(np.load(f"{source_dir}/array0.npy"), source)
+    np.testing.assert_array_equal(np.load(f"{output_dir}/array0.npy"), 0)
+
+
+def test_data_copies_input_arrays():
+    x = np.random.normal(size=(100, 3)).astype(np.float32)
+    data = Data(x)
+    assert not np.shares_memory(data.raw_data[0], x)